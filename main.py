@@ -9,6 +9,8 @@ SCREEN_WIDTH = 1280
 SCREEN_HEIGHT = 720
 PIXELS_PER_METER = 100  # base scale: 100 pixels = 1 meter at zoom 1.0
 FPS = 60
+FIXED_DT = 1 / 120            # seconds per simulation step
+MAX_UPDATES_PER_FRAME = 8     # drop simulation backlog beyond this (e.g. after a stall)
 
 # Zoom settings
 DEFAULT_ZOOM = 0.5   # start 2x more zoomed out than base
@@ -16,6 +18,12 @@ MIN_ZOOM = 0.15      # max zoom out
 MAX_ZOOM = 2.0       # max zoom in
 ZOOM_SPEED = 1.1     # multiplier per scroll notch
 
+# Zoom is always DEFAULT_ZOOM * ZOOM_SPEED ** step for an integer step,
+# clamped to MIN_ZOOM/MAX_ZOOM at the end steps, so only a few discrete
+# scales (and cached grid Surfaces) ever exist
+MIN_ZOOM_STEP = math.floor(math.log(MIN_ZOOM / DEFAULT_ZOOM, ZOOM_SPEED))
+MAX_ZOOM_STEP = math.ceil(math.log(MAX_ZOOM / DEFAULT_ZOOM, ZOOM_SPEED))
+
 # Voxel properties (1m x 1m 2D voxels)
 VOXEL_SIZE = 1.0  # meters per voxel side
 
@@ -24,6 +32,15 @@ PLAYER_LENGTH = 0.25  # meters (front to back)
 PLAYER_WIDTH = 0.5    # meters (side to side)
 PLAYER_SPEED = 1.5    # meters per second
 
+# Normalized (forward, right) multipliers for every digital WASD combination,
+# so diagonal movement isn't faster than straight movement
+MOVE_INPUT_SCALE = {
+    (forward, right): (forward / math.hypot(forward, right),
+                       right / math.hypot(forward, right))
+    for forward in (-1, 0, 1) for right in (-1, 0, 1)
+    if forward or right
+}
+
 # Colors
 BG_COLOR = (20, 20, 30)
 VOXEL_FILL_COLOR = (40, 45, 55)
@@ -40,6 +57,16 @@ def world_to_screen(world_x, world_y, camera_x, camera_y, ppm):
     return screen_x, screen_y
 
 
+def screen_transform(camera_x, camera_y, ppm):
+    """
+    Get (scale, offset_x, offset_y) such that screen = world * scale + offset.
+    Lets callers converting many points fold the camera math in once.
+    """
+    return (ppm,
+            SCREEN_WIDTH / 2 - camera_x * ppm,
+            SCREEN_HEIGHT / 2 - camera_y * ppm)
+
+
 def screen_to_world(screen_x, screen_y, camera_x, camera_y, ppm):
     """Convert screen coordinates (pixels) to world coordinates (meters)."""
     world_x = (screen_x - SCREEN_WIDTH / 2) / ppm + camera_x
@@ -47,14 +74,27 @@ def screen_to_world(screen_x, screen_y, camera_x, camera_y, ppm):
     return world_x, world_y
 
 
+def rotate_points(local_points, x, y, angle):
+    """Rotate local (x, y) offsets by angle (radians) and translate them to (x, y)."""
+    cos_a = math.cos(angle)
+    sin_a = math.sin(angle)
+    return [
+        (x + lx * cos_a - ly * sin_a, y + lx * sin_a + ly * cos_a)
+        for (lx, ly) in local_points
+    ]
+
+
 class VoxelGrid:
     """2D voxel grid with 1m x 1m cells."""
 
     def __init__(self):
         self.cell_size = VOXEL_SIZE  # 1 meter per cell
+        self._tile_cache = {}  # cell size in pixels -> pre-rendered voxel Surface
+        self._pattern = None   # tiled voxels covering the screen for _pattern_key
+        self._pattern_key = None  # (cell_size, ppm, pixel format) _pattern was built for
 
-    def get_visible_voxels(self, camera_x, camera_y, ppm):
-        """Get voxel grid coordinates visible on screen."""
+    def get_visible_range(self, camera_x, camera_y, ppm):
+        """Get the (col_start, col_end, row_start, row_end) range visible on screen."""
         # Calculate visible area in world coordinates with 1-cell padding
         half_width_m = (SCREEN_WIDTH / 2) / ppm + self.cell_size
         half_height_m = (SCREEN_HEIGHT / 2) / ppm + self.cell_size
@@ -64,33 +104,73 @@ class VoxelGrid:
         min_y = camera_y - half_height_m
         max_y = camera_y + half_height_m
 
-        # Snap to grid boundaries
-        col_start = int(math.floor(min_x / self.cell_size))
-        col_end = int(math.ceil(max_x / self.cell_size))
-        row_start = int(math.floor(min_y / self.cell_size))
-        row_end = int(math.ceil(max_y / self.cell_size))
+        # Snap to grid boundaries (floor division floors; negated it ceils)
+        cell = self.cell_size
+        col_start = int(min_x // cell)
+        col_end = -int(-max_x // cell)
+        row_start = int(min_y // cell)
+        row_end = -int(-max_y // cell)
 
-        voxels = []
-        for col in range(col_start, col_end):
-            for row in range(row_start, row_end):
-                # World position of voxel's top-left corner
-                wx = col * self.cell_size
-                wy = row * self.cell_size
-                voxels.append((wx, wy, col, row))
+        return col_start, col_end, row_start, row_end
 
-        return voxels
+    def get_visible_voxels(self, camera_x, camera_y, ppm):
+        """Get voxel grid coordinates visible on screen."""
+        col_start, col_end, row_start, row_end = self.get_visible_range(
+            camera_x, camera_y, ppm)
+
+        # World position of each voxel's top-left corner, per column and row
+        cell = self.cell_size
+        col_xs = [(col * cell, col) for col in range(col_start, col_end)]
+        row_ys = [(row * cell, row) for row in range(row_start, row_end)]
+
+        return [(wx, wy, col, row) for (wx, col) in col_xs for (wy, row) in row_ys]
 
     def draw(self, screen, camera_x, camera_y, ppm):
         """Draw the voxel grid."""
-        visible = self.get_visible_voxels(camera_x, camera_y, ppm)
-        size_px = self.cell_size * ppm
+        col_start, _, row_start, _ = self.get_visible_range(camera_x, camera_y, ppm)
 
-        for (wx, wy, col, row) in visible:
-            sx, sy = world_to_screen(wx, wy, camera_x, camera_y, ppm)
-            rect = pygame.Rect(sx, sy, size_px, size_px)
+        # The whole visible grid is one pre-tiled Surface; place its top-left
+        # voxel and let the blit clip the rest to the screen. Floor rather than
+        # truncate since that voxel is always off-screen (negative coords).
+        sx, sy = world_to_screen(col_start * self.cell_size, row_start * self.cell_size,
+                                 camera_x, camera_y, ppm)
+        screen.blit(self.get_pattern(ppm, screen), (math.floor(sx), math.floor(sy)))
 
-            pygame.draw.rect(screen, VOXEL_FILL_COLOR, rect)
-            pygame.draw.rect(screen, VOXEL_BORDER_COLOR, rect, 1)
+    def get_pattern(self, ppm, screen):
+        """
+        Get a Surface tiled with enough voxels to cover the screen at this scale.
+        The pattern is opaque and matches screen's pixel format, so the
+        per-frame blit is a straight copy with no conversion or blending.
+        It is rebuilt if a later screen has a different pixel format.
+        """
+        key = (self.cell_size, ppm, screen.get_bitsize(), screen.get_masks())
+        if self._pattern_key != key:
+            size_px = self.cell_size * ppm
+            tile = self.get_tile(size_px)
+
+            # Visible range spans the screen plus up to 2 cells of padding
+            # and 1 cell of snapping on each axis
+            cols = math.ceil(SCREEN_WIDTH / size_px) + 3
+            rows = math.ceil(SCREEN_HEIGHT / size_px) + 3
+            self._pattern = pygame.Surface((int(cols * size_px) + 1,
+                                            int(rows * size_px) + 1), 0, screen)
+            self._pattern.fill(BG_COLOR)
+            self._pattern.blits([(tile, (col * size_px, row * size_px))
+                                 for col in range(cols) for row in range(rows)],
+                                doreturn=False)
+            self._pattern_key = key
+        return self._pattern
+
+    def get_tile(self, size_px):
+        """Get a pre-rendered voxel Surface (fill + border) for a cell size in pixels."""
+        size = int(size_px)
+        tile = self._tile_cache.get(size)
+        if tile is None:
+            tile = pygame.Surface((size, size))
+            tile.fill(VOXEL_FILL_COLOR)
+            pygame.draw.rect(tile, VOXEL_BORDER_COLOR, tile.get_rect(), 1)
+            self._tile_cache[size] = tile
+        return tile
 
 
 class Player:
@@ -104,55 +184,64 @@ class Player:
         self.width = PLAYER_WIDTH    # side to side
         self.speed = PLAYER_SPEED
 
+        # Pose before the last simulation step, for interpolated drawing
+        self.prev_x = x
+        self.prev_y = y
+        self.prev_angle = self.angle
+
+        # Local corners (before rotation), rebuilt only when length/width change
+        self._local_corners_size = None  # (length, width) _local_corners is for
+        self._local_corners = None
+
+        # Screen-space corners from the last draw, reused while neither the
+        # player nor the view has changed
+        self._draw_cache_key = None
+        self._draw_cache_corners = None
+
+    def get_local_corners(self):
+        """Get the 4 corners of the player rectangle before rotation (cached)."""
+        size = (self.length, self.width)
+        if size != self._local_corners_size:
+            # Front is in positive x direction (local)
+            half_length = self.length / 2
+            half_width = self.width / 2
+            self._local_corners = (
+                (half_length, -half_width),   # front-right
+                (half_length, half_width),    # front-left
+                (-half_length, half_width),   # back-left
+                (-half_length, -half_width),  # back-right
+            )
+            self._local_corners_size = size
+        return self._local_corners
+
     def get_corners(self):
         """Get the 4 corners of the player rectangle in world coordinates."""
         # Rectangle centered on player position
         # Length is along the facing direction, width is perpendicular
-        half_length = self.length / 2
-        half_width = self.width / 2
-
-        # Local corners (before rotation)
-        # Front is in positive x direction (local)
-        local_corners = [
-            (half_length, -half_width),   # front-right
-            (half_length, half_width),    # front-left
-            (-half_length, half_width),   # back-left
-            (-half_length, -half_width),  # back-right
-        ]
-
         # Rotate and translate to world coordinates
-        cos_a = math.cos(self.angle)
-        sin_a = math.sin(self.angle)
-
-        world_corners = []
-        for (lx, ly) in local_corners:
-            wx = self.x + lx * cos_a - ly * sin_a
-            wy = self.y + lx * sin_a + ly * cos_a
-            world_corners.append((wx, wy))
-
-        return world_corners
+        return rotate_points(self.get_local_corners(), self.x, self.y, self.angle)
 
     def get_front_line(self):
         """Get the front line endpoints in world coordinates."""
-        half_length = self.length / 2
-        half_width = self.width / 2
-
-        # Front line in local coordinates
-        local_front = [
-            (half_length, -half_width),  # front-right
-            (half_length, half_width),   # front-left
-        ]
+        # Front line is the front-right/front-left corner pair
+        return self.get_corners()[:2]
 
-        cos_a = math.cos(self.angle)
-        sin_a = math.sin(self.angle)
+    def save_state(self):
+        """Remember the current pose as the previous simulation step's."""
+        self.prev_x = self.x
+        self.prev_y = self.y
+        self.prev_angle = self.angle
 
-        world_front = []
-        for (lx, ly) in local_front:
-            wx = self.x + lx * cos_a - ly * sin_a
-            wy = self.y + lx * sin_a + ly * cos_a
-            world_front.append((wx, wy))
-
-        return world_front
+    def get_render_pose(self, alpha):
+        """
+        Get the (x, y, angle) to draw, blended between the previous and
+        current simulation steps. alpha: 0 = previous step, 1 = current.
+        """
+        # Turn the short way round, across the +-pi seam if need be
+        turn = (self.angle - self.prev_angle + math.pi) % (2 * math.pi) - math.pi
+        return (self.prev_x + (self.x - self.prev_x) * alpha,
+                self.prev_y + (self.y - self.prev_y) * alpha,
+                self.prev_angle + turn * alpha)
 
     def face_towards(self, target_x, target_y):
         """Rotate to face towards a target point (world coordinates)."""
@@ -168,48 +257,57 @@ class Player:
         right: -1 to 1 (A/D, negative = left)
         dt: delta time in seconds
         """
+        if not forward and not right:
+            return
+
+        # Normalize so diagonal movement isn't faster (table lookup for the
+        # usual key combinations)
+        scale = MOVE_INPUT_SCALE.get((forward, right))
+        if scale is None:
+            magnitude = math.hypot(forward, right)
+            scale = (forward / magnitude, right / magnitude)
+        forward_scale, right_scale = scale
+
         # Forward direction
         fx = math.cos(self.angle)
         fy = math.sin(self.angle)
 
-        # Right direction (perpendicular to forward)
-        rx = math.cos(self.angle + math.pi / 2)
-        ry = math.sin(self.angle + math.pi / 2)
-
-        # Combined movement direction
-        move_x = forward * fx + right * rx
-        move_y = forward * fy + right * ry
-
-        # Normalize if moving diagonally
-        magnitude = math.sqrt(move_x * move_x + move_y * move_y)
-        if magnitude > 0:
-            move_x /= magnitude
-            move_y /= magnitude
-
-            # Apply movement
-            self.x += move_x * self.speed * dt
-            self.y += move_y * self.speed * dt
-
-    def draw(self, screen, camera_x, camera_y, ppm):
-        """Draw the player."""
-        # Get corners in screen coordinates
-        corners_world = self.get_corners()
-        corners_screen = [
-            world_to_screen(wx, wy, camera_x, camera_y, ppm)
-            for (wx, wy) in corners_world
-        ]
+        # Right direction (forward rotated by +90 degrees)
+        rx = -fy
+        ry = fx
+
+        # Combined movement direction (unit length: forward and right are
+        # orthonormal)
+        move_x = forward_scale * fx + right_scale * rx
+        move_y = forward_scale * fy + right_scale * ry
+
+        # Apply movement
+        self.x += move_x * self.speed * dt
+        self.y += move_y * self.speed * dt
+
+    def draw(self, screen, camera_x, camera_y, ppm, alpha=1.0):
+        """Draw the player, alpha of the way from its previous pose to its current one."""
+        x, y, angle = self.get_render_pose(alpha)
+
+        # Get corners in screen coordinates (cached while nothing moved)
+        local_corners = self.get_local_corners()
+        key = (x, y, angle, camera_x, camera_y, ppm, local_corners)
+        if key != self._draw_cache_key:
+            scale, offset_x, offset_y = screen_transform(camera_x, camera_y, ppm)
+            self._draw_cache_corners = [
+                (wx * scale + offset_x, wy * scale + offset_y)
+                for (wx, wy) in rotate_points(local_corners, x, y, angle)
+            ]
+            self._draw_cache_key = key
+        corners_screen = self._draw_cache_corners
 
         # Draw filled rectangle
         pygame.draw.polygon(screen, PLAYER_COLOR, corners_screen)
         # Draw border
         pygame.draw.polygon(screen, PLAYER_BORDER_COLOR, corners_screen, 2)
 
-        # Draw front line
-        front_world = self.get_front_line()
-        front_screen = [
-            world_to_screen(wx, wy, camera_x, camera_y, ppm)
-            for (wx, wy) in front_world
-        ]
+        # Draw front line (front-right/front-left corners, already converted)
+        front_screen = corners_screen[:2]
         pygame.draw.line(screen, PLAYER_FRONT_COLOR,
                         front_screen[0], front_screen[1], 3)
 
@@ -231,10 +329,16 @@ class Game:
         # Camera follows player
         self.camera_x = 0
         self.camera_y = 0
+        self.prev_camera_x = 0  # camera before the last simulation step
+        self.prev_camera_y = 0
 
         # Zoom
+        self.zoom_step = 0
         self.zoom = DEFAULT_ZOOM
 
+        # Mouse/view state the player last turned to face
+        self._last_face_input = None
+
         # UI overlay
         self.ui = GameUI(SCREEN_WIDTH, SCREEN_HEIGHT)
 
@@ -249,9 +353,25 @@ class Game:
                     self.running = False
             elif event.type == pygame.MOUSEWHEEL:
                 if event.y > 0:
-                    self.zoom = min(self.zoom * ZOOM_SPEED, MAX_ZOOM)
+                    self.zoom_by(1)
                 elif event.y < 0:
-                    self.zoom = max(self.zoom / ZOOM_SPEED, MIN_ZOOM)
+                    self.zoom_by(-1)
+
+    def zoom_by(self, steps):
+        """Zoom in (positive) or out (negative) by whole ZOOM_SPEED steps."""
+        self.zoom_step = max(MIN_ZOOM_STEP, min(self.zoom_step + steps, MAX_ZOOM_STEP))
+        self.zoom = max(MIN_ZOOM, min(DEFAULT_ZOOM * ZOOM_SPEED ** self.zoom_step, MAX_ZOOM))
+
+    def save_state(self):
+        """Remember the current state as the previous simulation step's."""
+        self.player.save_state()
+        self.prev_camera_x = self.camera_x
+        self.prev_camera_y = self.camera_y
+
+    def get_render_camera(self, alpha):
+        """Get the camera position to draw at, blended like Player.get_render_pose."""
+        return (self.prev_camera_x + (self.camera_x - self.prev_camera_x) * alpha,
+                self.prev_camera_y + (self.camera_y - self.prev_camera_y) * alpha)
 
     def update(self, dt):
         """Update game state."""
@@ -269,12 +389,16 @@ class Game:
         if keys[pygame.K_a]:
             right -= 1
 
-        # Get mouse position and make player face it
-        ppm = PIXELS_PER_METER * self.zoom
+        # Get mouse position and make player face it. The camera sits on the
+        # player, so the facing only changes when the mouse or view does.
         mouse_x, mouse_y = pygame.mouse.get_pos()
-        target_x, target_y = screen_to_world(mouse_x, mouse_y,
-                                              self.camera_x, self.camera_y, ppm)
-        self.player.face_towards(target_x, target_y)
+        face_input = (mouse_x, mouse_y, self.camera_x, self.camera_y, self.zoom)
+        if face_input != self._last_face_input:
+            ppm = PIXELS_PER_METER * self.zoom
+            target_x, target_y = screen_to_world(mouse_x, mouse_y,
+                                                  self.camera_x, self.camera_y, ppm)
+            self.player.face_towards(target_x, target_y)
+            self._last_face_input = face_input
 
         # Move player
         self.player.move(forward, right, dt)
@@ -283,31 +407,49 @@ class Game:
         self.camera_x = self.player.x
         self.camera_y = self.player.y
 
-    def draw(self):
-        """Draw the game."""
+    def draw(self, alpha=1.0):
+        """
+        Draw the game.
+        alpha: how far between the previous and current simulation steps to
+        draw (0 to 1), so motion stays smooth when steps and frames don't line up
+        """
         self.screen.fill(BG_COLOR)
         ppm = PIXELS_PER_METER * self.zoom
+        camera_x, camera_y = self.get_render_camera(alpha)
 
         # Draw voxel grid
-        self.voxel_grid.draw(self.screen, self.camera_x, self.camera_y, ppm)
+        self.voxel_grid.draw(self.screen, camera_x, camera_y, ppm)
 
         # Draw player
-        self.player.draw(self.screen, self.camera_x, self.camera_y, ppm)
+        self.player.draw(self.screen, camera_x, camera_y, ppm, alpha)
 
         # Draw UI overlay
         self.ui.draw(self.screen, self.player, self.voxel_grid,
-                     self.camera_x, self.camera_y, self.zoom)
+                     camera_x, camera_y, self.zoom)
 
         pygame.display.flip()
 
     def run(self):
         """Main game loop."""
+        accumulator = 0.0  # simulation time owed, in seconds
         while self.running:
-            dt = self.clock.tick(FPS) / 1000.0  # Delta time in seconds
+            accumulator += self.clock.tick(FPS) / 1000.0  # Delta time in seconds
 
             self.handle_events()
-            self.update(dt)
-            self.draw()
+
+            # Simulate in fixed steps, independent of frame timing jitter
+            updates = 0
+            while accumulator >= FIXED_DT and updates < MAX_UPDATES_PER_FRAME:
+                self.save_state()
+                self.update(FIXED_DT)
+                accumulator -= FIXED_DT
+                updates += 1
+            if updates == MAX_UPDATES_PER_FRAME:
+                accumulator = 0.0
+
+            # Draw the leftover fraction of a step between the last two states,
+            # so the frame's varying step count doesn't show up as judder
+            self.draw(accumulator / FIXED_DT)
 
         pygame.quit()
         sys.exit()
@@ -29,24 +29,25 @@ class GameWithUI(Game):
                         print(f"Action bar slot activated: {slot}")
             elif event.type == pygame.MOUSEWHEEL:
                 if event.y > 0:
-                    self.zoom = min(self.zoom * 1.1, 2.0)
+                    self.zoom_by(1)
                 elif event.y < 0:
-                    self.zoom = max(self.zoom / 1.1, 0.15)
+                    self.zoom_by(-1)
 
-    def draw(self):
+    def draw(self, alpha=1.0):
         """Draw the game with UI overlay."""
         self.screen.fill((20, 20, 30))
         ppm = PIXELS_PER_METER * self.zoom
+        camera_x, camera_y = self.get_render_camera(alpha)
 
         # Draw voxel grid
-        self.voxel_grid.draw(self.screen, self.camera_x, self.camera_y, ppm)
+        self.voxel_grid.draw(self.screen, camera_x, camera_y, ppm)
 
         # Draw player
-        self.player.draw(self.screen, self.camera_x, self.camera_y, ppm)
+        self.player.draw(self.screen, camera_x, camera_y, ppm, alpha)
 
         # Draw UI overlay
         self.ui.draw(self.screen, self.player, self.voxel_grid,
-                    self.camera_x, self.camera_y, self.zoom)
+                    camera_x, camera_y, self.zoom)
 
         pygame.display.flip()
 
@@ -17,6 +17,7 @@ GREEN = (0, 255, 100)
 PANEL_BG = (8, 8, 16)
 SLOT_BG = (14, 16, 28)
 SLOT_BG_PRESSED = (20, 24, 40)
+OVERLAY_COLORKEY = (255, 0, 255)  # transparent in pre-rendered overlays
 
 # Panel Dimensions
 PANEL_SIZE = 160
@@ -38,6 +39,9 @@ MINIMAP_INNER_MARGIN = 8
 # Corner Accent Size
 CORNER_SIZE = 8
 
+# Rendered text Surfaces kept before the cache is flushed
+TEXT_CACHE_SIZE = 256
+
 # Action Bar Key Mapping
 TOP_ROW_KEYS = [
     pygame.K_1, pygame.K_2, pygame.K_3, pygame.K_4, pygame.K_5, pygame.K_6,
@@ -81,14 +85,134 @@ class GameUI:
         # Action bar state
         self.active_slot = None  # (row, col) tuple
 
+        # Inner map area (with margin for label and borders) and the surface
+        # the map is composed on before being blitted there
+        self._minimap_area = pygame.Rect(
+            self.minimap_rect.x + MINIMAP_INNER_MARGIN,
+            self.minimap_rect.y + MINIMAP_INNER_MARGIN + 12,
+            self.minimap_rect.width - 2 * MINIMAP_INNER_MARGIN,
+            self.minimap_rect.height - 2 * MINIMAP_INNER_MARGIN - 12
+        )
+        self._minimap_clip = pygame.Surface(self._minimap_area.size)
+
+        # Minimap voxel marker, rebuilt only if the marker size changes
+        self._minimap_dot = None
+        # Pre-rendered minimap voxel layers keyed by camera sub-cell phase
+        self._minimap_layers = {}
+        # Candidate voxel centers around the camera's cell, for _minimap_centers_cell
+        self._minimap_centers = None
+        self._minimap_centers_cell = None
+
+        # Rendered text Surfaces keyed by (font, text, color)
+        self._text_cache = {}
+
+        # Action bar key labels never change, so render them once
+        self._key_label_surfs = [
+            [self._text(self.font_tiny, label, CYAN_DIM) for label in labels]
+            for labels in (TOP_ROW_LABELS, BOTTOM_ROW_LABELS)
+        ]
+
+        # Static panel layers (background, label, fixed text) drawn once
+        self._minimap_chrome = self._create_panel_chrome(self.minimap_rect, "SCAN")
+        self._stats_chrome = self._create_panel_chrome(self.stats_rect, "STATUS")
+        self._info_chrome = self._create_info_chrome()
+
+        # Stats and info panels are re-rendered only when their values change
+        self._stats_surface = pygame.Surface(self.stats_rect.size)
+        self._stats_drawn = None  # (health, stamina, focus) on _stats_surface
+        self._info_surface = pygame.Surface(self.info_rect.size)
+        self._info_drawn = None   # readout lines on _info_surface
+
+        # Action bar cells only change while keys are held, so pre-render both
+        # states
+        self._action_bar_base, self._pressed_cell_surfs = \
+            self._create_action_bar_surfaces()
+        # Orange border marking the active slot, drawn over its cell
+        self._active_cell_border = pygame.Surface((CELL_SIZE, CELL_SIZE))
+        self._active_cell_border.fill(OVERLAY_COLORKEY)
+        self._active_cell_border.set_colorkey(OVERLAY_COLORKEY, pygame.RLEACCEL)
+        pygame.draw.rect(self._active_cell_border, ORANGE,
+                         self._active_cell_border.get_rect(), 1)
+        # Per row: (key, (pressed surface, position)) ready for blits()
+        self._pressed_cell_blits = [
+            [(key, (self._pressed_cell_surfs[row][col], self._cell_rect(row, col).topleft))
+             for col, key in enumerate(TOP_ROW_KEYS)]
+            for row in range(ACTION_BAR_ROWS)
+        ]
+
+        # Panel borders and corner accents never change, so draw them once
+        self._border_overlays = self._create_border_overlays()
+
         # Create CRT scanline overlay (once at init)
         self.scanline_surface = self._create_scanline_overlay()
+        self._scanline_blits = [(self.scanline_surface, (0, y), None, pygame.BLEND_RGB_MULT)
+                                for y in range(0, screen_height, 3)]
+
+    def _text(self, font, text, color):
+        """Render text without antialiasing, reusing a cached Surface when possible."""
+        key = (font, text, color)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            # Coordinate readouts produce new strings as the player moves, so
+            # flush rather than grow without bound
+            if len(self._text_cache) >= TEXT_CACHE_SIZE:
+                self._text_cache.clear()
+            surface = font.render(text, False, color)
+            self._text_cache[key] = surface
+        return surface
+
+    def _create_panel_chrome(self, rect, label_text):
+        """Create a panel-sized Surface with the panel background and its label."""
+        surface = pygame.Surface(rect.size)
+        surface.fill(PANEL_BG)
+        surface.blit(self._text(self.font_tiny, label_text, ORANGE), (4, 2))
+        return surface
+
+    def _create_info_chrome(self):
+        """Create the info panel's static layer (background, label, divider, status)."""
+        surface = self._create_panel_chrome(self.info_rect, "SYSTEM")
+        rect = surface.get_rect()
+
+        # Divider line
+        divider_y = rect.bottom - 30
+        pygame.draw.line(surface, CYAN_DARK,
+                        (rect.x + 8, divider_y),
+                        (rect.right - 8, divider_y), 1)
+
+        # Status
+        status_text = self._text(self.font_tiny, "ONLINE", GREEN)
+        surface.blit(status_text, (rect.x + 8, divider_y + 6))
+        return surface
+
+    def _create_border_overlays(self):
+        """
+        Create panel-sized overlays with the cyan borders and orange corner
+        accents, as (surface, position) pairs ready for blits(). Everything
+        else is colorkeyed out; RLE colorkey blits only touch the border
+        pixels, unlike per-pixel alpha.
+        """
+        overlays = []
+        for rect, accents in ((self.minimap_rect, True), (self.stats_rect, True),
+                              (self.action_bar_rect, False), (self.info_rect, True)):
+            surface = pygame.Surface(rect.size)
+            surface.fill(OVERLAY_COLORKEY)
+            surface.set_colorkey(OVERLAY_COLORKEY, pygame.RLEACCEL)
+            pygame.draw.rect(surface, CYAN, surface.get_rect(), 2)
+            if accents:
+                self._draw_corner_accents(surface, surface.get_rect())
+            overlays.append((surface, rect.topleft))
+        return overlays
 
     def _create_scanline_overlay(self):
-        """Create a screen-sized surface with horizontal scanlines."""
-        surface = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA)
-        for y in range(0, self.screen_height, 3):
-            pygame.draw.line(surface, (0, 0, 0, 20), (0, y), (self.screen_width, y), 1)
+        """
+        Create a single screen-wide scanline. It is multiply-blended onto
+        every 3rd row, so only those rows are touched instead of
+        alpha-compositing a full-screen mostly transparent surface.
+        """
+        surface = pygame.Surface((self.screen_width, 1))
+        # x235/256 matches black at alpha 20 to within 1 level, and the
+        # multiply blitter is several times faster than the alpha one
+        surface.fill((235, 235, 235))
         return surface
 
     def _draw_corner_accents(self, screen, rect):
@@ -125,62 +249,32 @@ class GameUI:
                         (rect.right - 1, rect.bottom - 1),
                         (rect.right - 1, rect.bottom - CORNER_SIZE - 1), 2)
 
-    def _draw_minimap(self, screen, player, voxel_grid, camera_x, camera_y):
-        """Draw the minimap panel (top-left)."""
-        # Background
-        pygame.draw.rect(screen, PANEL_BG, self.minimap_rect)
-
-        # Label
-        label = self.font_tiny.render("SCAN", False, ORANGE)
-        screen.blit(label, (self.minimap_rect.x + 4, self.minimap_rect.y + 2))
-
-        # Inner map area (with margin for label and borders)
-        map_area = pygame.Rect(
-            self.minimap_rect.x + MINIMAP_INNER_MARGIN,
-            self.minimap_rect.y + MINIMAP_INNER_MARGIN + 12,
-            self.minimap_rect.width - 2 * MINIMAP_INNER_MARGIN,
-            self.minimap_rect.height - 2 * MINIMAP_INNER_MARGIN - 12
-        )
+    def _draw_minimap(self, blits, player, voxel_grid, camera_x, camera_y, cos_a, sin_a):
+        """
+        Draw the minimap panel (top-left), appending its screen blits to blits.
+        cos_a/sin_a are of the player's angle.
+        """
+        # Background and label
+        blits.append((self._minimap_chrome, self.minimap_rect.topleft))
 
-        # Dark background for map area
-        pygame.draw.rect(screen, (4, 4, 8), map_area)
+        map_area = self._minimap_area
 
         # Calculate scale for minimap (world meters to screen pixels)
         scale = min(map_area.width, map_area.height) / (2 * MINIMAP_RADIUS)
 
-        # Create a clipping surface for the map area
-        clip_surface = pygame.Surface((map_area.width, map_area.height))
-        clip_surface.fill((4, 4, 8))
+        # Clipping surface for the map area (fully covered by the voxel layer)
+        clip_surface = self._minimap_clip
 
-        # Draw voxel grid within radius
+        # Voxel markers only depend on where the camera sits within its cell,
+        # so reuse a layer rendered for that sub-cell phase (in minimap pixels)
         cell = voxel_grid.cell_size
-        col_start = int(math.floor((camera_x - MINIMAP_RADIUS) / cell)) - 1
-        col_end = int(math.ceil((camera_x + MINIMAP_RADIUS) / cell)) + 1
-        row_start = int(math.floor((camera_y - MINIMAP_RADIUS) / cell)) - 1
-        row_end = int(math.ceil((camera_y + MINIMAP_RADIUS) / cell)) + 1
+        phase_x = int((camera_x % cell) * scale)
+        phase_y = int((camera_y % cell) * scale)
+        clip_surface.blit(self._get_minimap_voxel_layer(map_area.size, cell, scale,
+                                                        phase_x, phase_y), (0, 0))
 
         half_w = map_area.width // 2
         half_h = map_area.height // 2
-        voxel_px = max(1, int(cell * scale))
-
-        for col in range(col_start, col_end):
-            for row in range(row_start, row_end):
-                # Voxel center
-                cx = (col + 0.5) * cell
-                cy = (row + 0.5) * cell
-
-                dx = cx - camera_x
-                dy = cy - camera_y
-                dist = math.sqrt(dx * dx + dy * dy)
-
-                if dist <= MINIMAP_RADIUS:
-                    clip_x = int(dx * scale) + half_w
-                    clip_y = int(dy * scale) + half_h
-
-                    if 0 <= clip_x < map_area.width and 0 <= clip_y < map_area.height:
-                        r = pygame.Rect(clip_x - voxel_px // 2, clip_y - voxel_px // 2,
-                                        voxel_px, voxel_px)
-                        clip_surface.fill(CYAN_DARK, r)
 
         # Draw player position and direction
         player_dx = player.x - camera_x
@@ -193,23 +287,98 @@ class GameUI:
             pygame.draw.circle(clip_surface, ORANGE, (player_map_x, player_map_y), 2)
 
             # Direction line (4px long)
-            dir_x = int(player_map_x + 4 * math.cos(player.angle))
-            dir_y = int(player_map_y + 4 * math.sin(player.angle))
+            dir_x = int(player_map_x + 4 * cos_a)
+            dir_y = int(player_map_y + 4 * sin_a)
             pygame.draw.line(clip_surface, ORANGE,
                            (player_map_x, player_map_y),
                            (dir_x, dir_y), 1)
 
         # Blit the clipped surface to screen
-        screen.blit(clip_surface, map_area.topleft)
+        blits.append((clip_surface, map_area.topleft))
+
+    def _get_minimap_voxel_layer(self, size, cell, scale, phase_x, phase_y):
+        """Get the (cached) minimap voxel layer for a camera sub-cell phase."""
+        key = (size, cell, scale, phase_x, phase_y)
+        layer = self._minimap_layers.get(key)
+        if layer is None:
+            # Render for the middle of the phase's pixel
+            layer = self._render_minimap_voxels(size, cell, scale,
+                                                (phase_x + 0.5) / scale,
+                                                (phase_y + 0.5) / scale)
+            self._minimap_layers[key] = layer
+        return layer
+
+    def _get_minimap_voxel_centers(self, cell):
+        """
+        Get the (cached) voxel centers, relative to the camera's cell origin,
+        that can fall within MINIMAP_RADIUS for any camera position in that cell.
+        """
+        if self._minimap_centers_cell != cell:
+            first = int(math.floor(-MINIMAP_RADIUS / cell)) - 1
+            last = int(math.ceil((cell + MINIMAP_RADIUS) / cell)) + 1
+            self._minimap_centers = [
+                ((col + 0.5) * cell, (row + 0.5) * cell)
+                for col in range(first, last) for row in range(first, last)
+            ]
+            self._minimap_centers_cell = cell
+        return self._minimap_centers
+
+    def _render_minimap_voxels(self, size, cell, scale, camera_x, camera_y):
+        """
+        Render voxel markers within MINIMAP_RADIUS of the camera onto a new
+        Surface. camera_x/camera_y are relative to the camera's cell origin.
+        """
+        width, height = size
+        layer = pygame.Surface(size)
+        layer.fill((4, 4, 8))
+
+        half_w = width // 2
+        half_h = height // 2
+
+        # With at least one voxel per minimap pixel every pixel in the radius
+        # is covered, and the candidate count (~(2 * radius / cell)^2) can
+        # explode, so draw the disc directly
+        if cell * scale <= 1:
+            pygame.draw.circle(layer, CYAN_DARK, (half_w, half_h),
+                               int(MINIMAP_RADIUS * scale))
+            return layer
+
+        voxel_px = max(1, int(cell * scale))
+
+        # Loop invariants (compare squared distances to skip the sqrt)
+        radius_sq = MINIMAP_RADIUS * MINIMAP_RADIUS
+        dot_half = voxel_px // 2
+
+        # Collect every voxel marker position within radius, then stamp them
+        # all in one call
+        dot_positions = []
+        append = dot_positions.append
+        for (cx, cy) in self._get_minimap_voxel_centers(cell):
+            dx = cx - camera_x
+            dy = cy - camera_y
 
-        # Border and accents
-        pygame.draw.rect(screen, CYAN, self.minimap_rect, 2)
-        self._draw_corner_accents(screen, self.minimap_rect)
+            if dx * dx + dy * dy <= radius_sq:
+                clip_x = int(dx * scale) + half_w
+                clip_y = int(dy * scale) + half_h
+
+                if 0 <= clip_x < width and 0 <= clip_y < height:
+                    append((clip_x - dot_half, clip_y - dot_half))
+
+        dot = self._get_minimap_dot(voxel_px)
+        layer.blits([(dot, pos) for pos in dot_positions], doreturn=False)
+        return layer
+
+    def _get_minimap_dot(self, size):
+        """Get the (cached) square Surface used to mark a voxel on the minimap."""
+        if self._minimap_dot is None or self._minimap_dot.get_width() != size:
+            self._minimap_dot = pygame.Surface((size, size))
+            self._minimap_dot.fill(CYAN_DARK)
+        return self._minimap_dot
 
     def _draw_stat_bar(self, screen, x, y, width, label, value, color, color_dim):
         """Draw a single stat bar with label, value, and progress bar."""
         # Label and value on same line
-        text = self.font_tiny.render(f"{label}: {int(value * 100)}", False, CYAN)
+        text = self._text(self.font_tiny, f"{label}: {int(value * 100)}", CYAN)
         screen.blit(text, (x, y))
 
         # Progress bar below
@@ -234,125 +403,127 @@ class GameUI:
         # Border
         pygame.draw.rect(screen, CYAN_DARK, bar_bg_rect, 1)
 
-    def _draw_stats_panel(self, screen):
-        """Draw the stats panel (bottom-left)."""
-        # Background
-        pygame.draw.rect(screen, PANEL_BG, self.stats_rect)
+    def _draw_stats_panel(self, blits):
+        """
+        Draw the stats panel (bottom-left), appending its screen blit to blits.
+        The panel is re-rendered only when a stat changed.
+        """
+        stats = (self.health, self.stamina, self.focus)
+        if stats != self._stats_drawn:
+            self._render_stats_panel(self._stats_surface)
+            self._stats_drawn = stats
+        blits.append((self._stats_surface, self.stats_rect.topleft))
 
-        # Label
-        label = self.font_tiny.render("STATUS", False, ORANGE)
-        screen.blit(label, (self.stats_rect.x + 4, self.stats_rect.y + 2))
+    def _render_stats_panel(self, surface):
+        """Render the stats panel onto a panel-sized surface."""
+        rect = surface.get_rect()
+
+        # Background and label
+        surface.blit(self._stats_chrome, rect)
 
         # Three stat bars
-        bar_x = self.stats_rect.x + 10
-        bar_width = self.stats_rect.width - 20
+        bar_x = rect.x + 10
+        bar_width = rect.width - 20
         bar_spacing = 40
 
         # HP
-        self._draw_stat_bar(screen, bar_x, self.stats_rect.y + 25, bar_width,
+        self._draw_stat_bar(surface, bar_x, rect.y + 25, bar_width,
                           "HP", self.health, ORANGE, ORANGE_DIM)
 
         # Stamina
-        self._draw_stat_bar(screen, bar_x, self.stats_rect.y + 25 + bar_spacing, bar_width,
+        self._draw_stat_bar(surface, bar_x, rect.y + 25 + bar_spacing, bar_width,
                           "ST", self.stamina, CYAN, CYAN_DIM)
 
         # Focus
-        self._draw_stat_bar(screen, bar_x, self.stats_rect.y + 25 + 2 * bar_spacing, bar_width,
+        self._draw_stat_bar(surface, bar_x, rect.y + 25 + 2 * bar_spacing, bar_width,
                           "FC", self.focus, PURPLE, PURPLE_DIM)
 
-        # Border and accents
-        pygame.draw.rect(screen, CYAN, self.stats_rect, 2)
-        self._draw_corner_accents(screen, self.stats_rect)
-
-    def _draw_action_bar(self, screen):
-        """Draw the action bar (bottom-middle, 12x2 grid)."""
-        # Background
-        pygame.draw.rect(screen, PANEL_BG, self.action_bar_rect)
-
+    def _draw_action_bar(self, blits):
+        """Draw the action bar (bottom-middle, 12x2 grid), appending its screen blits to blits."""
         # Get current key state
         keys = pygame.key.get_pressed()
         mods = pygame.key.get_mods()
-        shift_held = mods & pygame.KMOD_SHIFT
-
-        # Draw cells
+        pressed_row = 1 if mods & pygame.KMOD_SHIFT else 0
+
+        # Unpressed cells, then brighter cells for held keys (shift selects
+        # the bottom row)
+        blits.append((self._action_bar_base, self.action_bar_rect.topleft))
+        blits.extend(blit for (key, blit) in self._pressed_cell_blits[pressed_row]
+                     if keys[key])
+
+        # Active slot border (orange over the dark cyan one)
+        if self.active_slot is not None:
+            blits.append((self._active_cell_border,
+                          self._cell_rect(*self.active_slot).topleft))
+
+    def _cell_rect(self, row, col):
+        """Get the screen rect of an action bar cell."""
+        return pygame.Rect(self.action_bar_rect.x + col * CELL_SIZE,
+                           self.action_bar_rect.y + row * CELL_SIZE,
+                           CELL_SIZE, CELL_SIZE)
+
+    def _draw_action_bar_cell(self, surface, x, y, row, col, bg_color):
+        """Draw one action bar cell (background, border, key label) at (x, y)."""
+        cell_rect = pygame.Rect(x, y, CELL_SIZE, CELL_SIZE)
+        pygame.draw.rect(surface, bg_color, cell_rect)
+        pygame.draw.rect(surface, CYAN_DARK, cell_rect, 1)
+
+        # Key label in top-left corner
+        surface.blit(self._key_label_surfs[row][col], (x + 3, y + 2))
+
+    def _create_action_bar_surfaces(self):
+        """
+        Pre-render the action bar with every cell unpressed, plus one
+        pressed-state Surface per cell to blit over it while its key is held.
+        """
+        base = pygame.Surface(self.action_bar_rect.size)
+        base.fill(PANEL_BG)
+        pressed = []
         for row in range(ACTION_BAR_ROWS):
+            pressed_row = []
             for col in range(ACTION_BAR_COLS):
-                cell_x = self.action_bar_rect.x + col * CELL_SIZE
-                cell_y = self.action_bar_rect.y + row * CELL_SIZE
-                cell_rect = pygame.Rect(cell_x, cell_y, CELL_SIZE, CELL_SIZE)
-
-                # Check if this key is pressed
-                key_pressed = False
-                if col < len(TOP_ROW_KEYS):
-                    if row == 0 and keys[TOP_ROW_KEYS[col]] and not shift_held:
-                        key_pressed = True
-                    elif row == 1 and keys[TOP_ROW_KEYS[col]] and shift_held:
-                        key_pressed = True
-
-                # Cell background (brighter if pressed)
-                bg_color = SLOT_BG_PRESSED if key_pressed else SLOT_BG
-                pygame.draw.rect(screen, bg_color, cell_rect)
-
-                # Cell border (orange if active slot, dark cyan otherwise)
-                border_color = ORANGE if self.active_slot == (row, col) else CYAN_DARK
-                pygame.draw.rect(screen, border_color, cell_rect, 1)
-
-                # Key label in top-left corner
-                if row == 0:
-                    label_text = TOP_ROW_LABELS[col]
-                else:
-                    label_text = BOTTOM_ROW_LABELS[col]
-
-                label = self.font_tiny.render(label_text, False, CYAN_DIM)
-                screen.blit(label, (cell_x + 3, cell_y + 2))
-
-        # Outer border
-        pygame.draw.rect(screen, CYAN, self.action_bar_rect, 2)
-
-    def _draw_info_panel(self, screen, player, zoom):
-        """Draw the info panel (bottom-right)."""
-        # Background
-        pygame.draw.rect(screen, PANEL_BG, self.info_rect)
-
-        # Label
-        label = self.font_tiny.render("SYSTEM", False, ORANGE)
-        screen.blit(label, (self.info_rect.x + 4, self.info_rect.y + 2))
-
-        # Player info
-        info_x = self.info_rect.x + 8
-        info_y = self.info_rect.y + 25
-        line_height = 18
+                self._draw_action_bar_cell(base, col * CELL_SIZE, row * CELL_SIZE,
+                                           row, col, SLOT_BG)
 
-        # X coordinate
-        x_text = self.font_tiny.render(f"X:{player.x:+.1f}", False, CYAN)
-        screen.blit(x_text, (info_x, info_y))
+                cell = pygame.Surface((CELL_SIZE, CELL_SIZE))
+                self._draw_action_bar_cell(cell, 0, 0, row, col, SLOT_BG_PRESSED)
+                pressed_row.append(cell)
+            pressed.append(pressed_row)
+        return base, pressed
 
-        # Y coordinate
-        y_text = self.font_tiny.render(f"Y:{player.y:+.1f}", False, CYAN)
-        screen.blit(y_text, (info_x, info_y + line_height))
+    def _draw_info_panel(self, blits, player, heading, zoom):
+        """
+        Draw the info panel (bottom-right), appending its screen blit to blits.
+        The panel is re-rendered only when the displayed text changed.
+        """
+        # Readouts at display precision; sub-0.1m movement or sub-degree
+        # turning leaves them (and the cached panel) unchanged
+        lines = (
+            f"X:{player.x:+.1f}",     # X coordinate
+            f"Y:{player.y:+.1f}",     # Y coordinate
+            f"HDG:{heading:03.0f}",   # Heading (degrees)
+            f"ZM:{zoom:.1f}x",        # Zoom
+        )
+        if lines != self._info_drawn:
+            self._render_info_panel(self._info_surface, lines)
+            self._info_drawn = lines
+        blits.append((self._info_surface, self.info_rect.topleft))
 
-        # Heading (convert radians to degrees)
-        degrees = (math.degrees(player.angle) % 360)
-        hdg_text = self.font_tiny.render(f"HDG:{degrees:03.0f}", False, CYAN)
-        screen.blit(hdg_text, (info_x, info_y + 2 * line_height))
+    def _render_info_panel(self, surface, lines):
+        """Render the info panel with the given readout lines onto a panel-sized surface."""
+        rect = surface.get_rect()
 
-        # Zoom
-        zoom_text = self.font_tiny.render(f"ZM:{zoom:.1f}x", False, CYAN)
-        screen.blit(zoom_text, (info_x, info_y + 3 * line_height))
+        # Background, label and status
+        surface.blit(self._info_chrome, rect)
 
-        # Divider line
-        divider_y = self.info_rect.bottom - 30
-        pygame.draw.line(screen, CYAN_DARK,
-                        (self.info_rect.x + 8, divider_y),
-                        (self.info_rect.right - 8, divider_y), 1)
-
-        # Status
-        status_text = self.font_tiny.render("ONLINE", False, GREEN)
-        screen.blit(status_text, (info_x, divider_y + 6))
+        # Player info
+        info_x = rect.x + 8
+        info_y = rect.y + 25
+        line_height = 18
 
-        # Border and accents
-        pygame.draw.rect(screen, CYAN, self.info_rect, 2)
-        self._draw_corner_accents(screen, self.info_rect)
+        for i, line in enumerate(lines):
+            text = self._text(self.font_tiny, line, CYAN)
+            surface.blit(text, (info_x, info_y + i * line_height))
 
     def handle_event(self, event):
         """
@@ -377,17 +548,31 @@ class GameUI:
 
     def draw(self, screen, player, voxel_grid, camera_x, camera_y, zoom):
         """Draw all UI panels and scanline overlay."""
+        # Player heading, computed once for every panel that shows it
+        cos_a = math.cos(player.angle)
+        sin_a = math.sin(player.angle)
+        heading = math.degrees(player.angle) % 360
+
+        # Panels only append (surface, position) pairs; everything reaches the
+        # screen in a single blits() call, in this order
+        blits = []
+
         # Draw minimap
-        self._draw_minimap(screen, player, voxel_grid, camera_x, camera_y)
+        self._draw_minimap(blits, player, voxel_grid, camera_x, camera_y, cos_a, sin_a)
 
         # Draw stats panel
-        self._draw_stats_panel(screen)
+        self._draw_stats_panel(blits)
 
         # Draw action bar
-        self._draw_action_bar(screen)
+        self._draw_action_bar(blits)
 
         # Draw info panel
-        self._draw_info_panel(screen, player, zoom)
+        self._draw_info_panel(blits, player, heading, zoom)
+
+        # Draw panel borders and corner accents
+        blits.extend(self._border_overlays)
 
         # Draw CRT scanline overlay
-        screen.blit(self.scanline_surface, (0, 0))
+        blits.extend(self._scanline_blits)
+
+        screen.blits(blits, doreturn=False)